@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_alter_booking_end_date_alter_booking_start_date'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['office', 'start_date', 'end_date'], name='booking_office_dates_idx'),
+        ),
+    ]
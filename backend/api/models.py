@@ -44,6 +44,11 @@ class Booking(models.Model):
     total_price = models.DecimalField(max_digits=10, decimal_places=2)
     status = models.CharField(max_length=50, default='confirmed')
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['office', 'start_date', 'end_date'], name='booking_office_dates_idx'),
+        ]
+
     def __str__(self):
         return f"Booking for {self.office.name} by {self.user.username}"
 
@@ -45,3 +45,61 @@ class BookingTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
 
+
+class OfficeAvailabilityTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', email='test@example.com', password='testpassword')
+
+        self.booked_office = Office.objects.create(
+            name='Booked Office',
+            address='1 Test St',
+            description='A booked office',
+            price=1000.00,
+            owner=self.user
+        )
+        self.free_office = Office.objects.create(
+            name='Free Office',
+            address='2 Test St',
+            description='A free office',
+            price=1000.00,
+            owner=self.user
+        )
+        self.start = date.today() + timedelta(days=10)
+        Booking.objects.create(
+            user=self.user,
+            office=self.booked_office,
+            start_date=self.start,
+            end_date=self.start + timedelta(days=5),
+            total_price=500.00
+        )
+
+    def get_available(self, available_from, available_to):
+        return self.client.get('/api/offices/', {
+            'available_from': available_from.isoformat(),
+            'available_to': available_to.isoformat(),
+        })
+
+    def test_overlapping_booking_excludes_office(self):
+        response = self.get_available(self.start + timedelta(days=5), self.start + timedelta(days=8))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([office['id'] for office in response.data], [self.free_office.id])
+
+    def test_non_overlapping_range_includes_office(self):
+        response = self.get_available(self.start + timedelta(days=6), self.start + timedelta(days=8))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+    def test_cancelled_booking_is_ignored(self):
+        Booking.objects.update(status='cancelled')
+        response = self.get_available(self.start, self.start + timedelta(days=1))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+    def test_invalid_range_is_rejected(self):
+        response = self.get_available(self.start + timedelta(days=1), self.start)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get('/api/offices/', {'available_from': 'not-a-date', 'available_to': '2030-01-01'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get('/api/offices/', {'available_from': self.start.isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
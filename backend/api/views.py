@@ -2,6 +2,9 @@ from rest_framework import viewsets
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.exceptions import ValidationError
+from django.db.models import Exists, OuterRef
+from django.utils.dateparse import parse_date
 from .models import User, Office, Booking, Review, OfficeType
 from .serializers import UserSerializer, OfficeSerializer, BookingSerializer, ReviewSerializer, OfficeTypeSerializer
 from rest_framework_simplejwt.views import TokenObtainPairView
@@ -23,6 +26,37 @@ class OfficeViewSet(viewsets.ModelViewSet):
     serializer_class = OfficeSerializer
     permission_classes = [AllowAny]
 
+    def get_queryset(self):
+        queryset = self.queryset.all()
+        available_from = self.request.query_params.get('available_from')
+        available_to = self.request.query_params.get('available_to')
+        if available_from or available_to:
+            start_date, end_date = self._parse_date_range(available_from, available_to)
+            # Keep only offices with no active booking overlapping the range
+            # (both ends inclusive, same as BookingForm). Evaluated as a single
+            # NOT EXISTS over the (office, start_date, end_date) index.
+            overlapping = Booking.objects.filter(
+                office=OuterRef('pk'),
+                start_date__lte=end_date,
+                end_date__gte=start_date,
+            ).exclude(status='cancelled')
+            queryset = queryset.filter(~Exists(overlapping))
+        return queryset
+
+    def _parse_date_range(self, available_from, available_to):
+        if not available_from or not available_to:
+            raise ValidationError('Both available_from and available_to are required.')
+        try:
+            start_date = parse_date(available_from)
+            end_date = parse_date(available_to)
+        except ValueError:
+            start_date = end_date = None
+        if start_date is None or end_date is None:
+            raise ValidationError('Dates must be in YYYY-MM-DD format.')
+        if start_date > end_date:
+            raise ValidationError('available_from must not be after available_to.')
+        return start_date, end_date
+
 class BookingViewSet(viewsets.ModelViewSet):
     queryset = Booking.objects.all()
     serializer_class = BookingSerializer